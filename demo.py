@@ -19,9 +19,9 @@ font_axes = {
 }
 
 pm = PaletteManager()
-pm.apply_config_transforms() # Apply settings from config
 
-# Optional: Apply manual overrides
+# Optional: Apply manual overrides (load_palette_by_index applies the
+# config transforms itself, so no separate apply_config_transforms call)
 (
     pm
     .load_palette_by_index(
@@ -32,11 +32,37 @@ pm.apply_config_transforms() # Apply settings from config
 
 # pm.save_config()
 
+# Palette is static during the animation, so resolve colors once
+# instead of doing dict/list lookups every frame
+bg_color = pm.get_color('bg')
+fg_color = pm.get_color('fg')
+accent_color = pm.get_color('accent')
+ornament_color = pm[1]
+
+# Shaping+layout dominates Skia text cost, so build each glyph once at
+# module load and clone per frame; only the time-varying transforms
+# (rotate/scale/align) happen in the callback
+m_base = StSt("m", font_name, font_size, **font_axes).scale(2.80)
+eq_base = StSt("=", font_name, font_size*1.5, **font_axes)
+star_base = StSt("*", font_name, font_size, **font_axes)
+
+# Star offsets are frame-invariant; precompute the table instead of
+# dispatching np.pow/np.sin per element per frame
+star_offsets = [(1e3*np.sin(2*e), 3.3e3*np.sin(3*e)) for e in range(4)]
+
 aspect = 16/9
 width = 1920
 height = width / aspect
 dims = (width,height)
 
+# The frame rect, filter params, and palette are all constant for the
+# animation, so build the three phototype filters once rather than
+# allocating new Skia shader pipelines every frame
+frame_rect = Rect(width, height)
+ornament_pt = phototype(frame_rect, 2.57, 83, 26, ornament_color)
+fg_pt = phototype(frame_rect, 1.06, 64, 23, fg_color)
+accent_pt = phototype(frame_rect, 1.47, 64, 23, accent_color)
+
 @animation(dims, tl=midi)
 def scratch(f:Frame):
   all_four = midi.ki(24)
@@ -46,19 +72,12 @@ def scratch(f:Frame):
   composition = P()
 
   # Draw background first
-  composition += P().rect(f.a.r).f(pm.get_color('bg')) # Use named color for background
+  composition += P().rect(f.a.r).f(bg_color) # Use named color for background
 
   # Add ornaments
   composition += (
     P(
-      [StSt(
-        "m",
-        font_name,
-        font_size,
-        **font_axes
-      )
-      .scale(2.80)
-      for x in range(4)]
+      [m_base.copy() for x in range(4)]
     )
     .mapv(lambda e,p: p
       .rotate(e*132*upbeats.adsr((10,10),rng=(0.84,0.82)))
@@ -73,18 +92,12 @@ def scratch(f:Frame):
     )
     .scale(0.31*all_four.adsr((10,10),rng=(0.8,0.73)))
     .align(f.a.r, "C")
-    .ch(phototype(f.a.r, 2.57, 83, 26, pm[1])) # Example using indexed color
+    .ch(ornament_pt) # Example using indexed color
   )
 
   composition += (
     P(
-      [StSt(
-        "=",
-        font_name,
-        font_size*1.5,
-        **font_axes
-      )
-      for x in range(3)]
+      [eq_base.copy() for x in range(3)]
     )
     .mapv(lambda e,p: p
       .rotate(e*115*downbeats.adsr((10,10),rng=(0.90,0.95)))
@@ -100,28 +113,22 @@ def scratch(f:Frame):
     .rotate(-86)
     .scale(1.30,0.41)
     .align(f.a.r, "C")
-    .ch(phototype(f.a.r, 1.06, 64, 23, pm.get_color('fg'))) # Example using named color
+    .ch(fg_pt) # Example using named color
   )
 
   composition += (
     P(
-      [StSt(
-        "*",
-        font_name,
-        font_size,
-        **font_axes
-      )
-      for x in range(4)]
+      [star_base.copy() for x in range(4)]
     )
     .mapv(lambda e,p: p
       .rotate(23*all_four.adsr((10,10),rng=(0.58,0.95)))
       .scale(1.32,1.84)
-      .offset(1.0*np.pow(10,3)*np.sin(2*e), 3.3*np.pow(10,3)*np.sin(3*e))
+      .offset(*star_offsets[e])
     )
     .rotate(-9)
     .scale(0.70,0.21)
     .align(f.a.r,"C")
-    .ch(phototype(f.a.r, 1.47, 64, 23, pm.get_color('accent'))) # Example using named color
+    .ch(accent_pt) # Example using named color
   )
 
   # Add palette preview
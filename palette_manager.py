@@ -1,49 +1,232 @@
 import json
+import functools
+import logging
+import re
 import numpy as np
-import colorsys
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from coldtype import *
-from pypalettes import load_cmap, get_colors
 
-
-# Helper function for sorting keys with error handling
+# pypalettes and colorsys are imported lazily: pypalettes touches its dataset
+# at import time, and colorsys is only needed on the scalar fallback paths
+
+log = logging.getLogger(__name__)
+
+
+# Memoized load_cmap: palette switches hit the pypalettes dataset once per name
+@functools.lru_cache(maxsize=64)
+def _load_cmap_cached(name):
+    from pypalettes import load_cmap
+    return load_cmap(name)
+
+# Optional Numba acceleration for the batch hex->HLS decode; the NumPy
+# pipeline below is the fallback when numba is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# ASCII -> hex-nibble lookup table, built once at import
+_HEX_NIBBLE = np.zeros(256, dtype=np.uint8)
+for _i, _ch in enumerate("0123456789abcdef"):
+    _HEX_NIBBLE[ord(_ch)] = _i
+    _HEX_NIBBLE[ord(_ch.upper())] = _i
+del _i, _ch
+
+
+def _hex_to_code_array(hex_colors):
+    """Packs '#rrggbb' (or '#rrggbbaa') strings into an (N, 6) uint8 array of ASCII codes.
+
+    Accepts either a sequence of str or a bytes-dtype ndarray; the latter is a
+    zero-copy view.
+    """
+    if isinstance(hex_colors, np.ndarray) and hex_colors.dtype.kind == 'S':
+        width = hex_colors.dtype.itemsize
+        codes = hex_colors.view(np.uint8).reshape(len(hex_colors), width)
+    else:
+        n = len(hex_colors)
+        width = len(hex_colors[0])
+        raw = np.frombuffer("".join(hex_colors).encode("ascii"), dtype=np.uint8)
+        codes = raw.reshape(n, width)
+    return codes[:, 1:7]  # drop the leading '#' and any alpha suffix
+
+
+def _hex_to_rgb_array(hex_colors):
+    """Decodes a sequence of '#rrggbb' (or '#rrggbbaa') strings into an (N, 3) float32 array in [0, 1]."""
+    nibbles = _HEX_NIBBLE[_hex_to_code_array(hex_colors)]
+    rgb = nibbles[:, 0::2] * 16 + nibbles[:, 1::2]
+    return rgb.astype(np.float32) / 255.0
+
+
+def _rgb_to_hls_array(rgb):
+    """Vectorized equivalent of colorsys.rgb_to_hls over an (N, 3) array.
+
+    Returns three (N,) arrays: hue, lightness, saturation.
+    """
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    mx = rgb.max(axis=1)
+    mn = rgb.min(axis=1)
+    l = (mx + mn) * 0.5
+    d = mx - mn
+    s = np.where(l < 0.5, d / (mx + mn + 1e-12), d / (2.0 - mx - mn + 1e-12))
+    d_safe = np.where(d == 0, 1.0, d)
+    # Branchless six-case hue split: argmax picks the sector (matching
+    # colorsys's r-then-g-then-b priority), choose gathers the sector formula
+    sector = rgb.argmax(axis=1)
+    h = np.choose(sector, [
+        (g - b) / d_safe,
+        2.0 + (b - r) / d_safe,
+        4.0 + (r - g) / d_safe,
+    ])
+    h = np.where(d == 0, 0.0, (h / 6.0) % 1.0)
+    return h, l, s
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _codes_to_hls_jit(codes, lut, out):
+        for i in range(codes.shape[0]):
+            r = (lut[codes[i, 0]] * 16.0 + lut[codes[i, 1]]) / 255.0
+            g = (lut[codes[i, 2]] * 16.0 + lut[codes[i, 3]]) / 255.0
+            b = (lut[codes[i, 4]] * 16.0 + lut[codes[i, 5]]) / 255.0
+            mx = max(r, g, b)
+            mn = min(r, g, b)
+            l = (mx + mn) * 0.5
+            if mx == mn:
+                h = 0.0
+                s = 0.0
+            else:
+                d = mx - mn
+                s = d / (mx + mn) if l < 0.5 else d / (2.0 - mx - mn)
+                if mx == r:
+                    h = (g - b) / d
+                elif mx == g:
+                    h = 2.0 + (b - r) / d
+                else:
+                    h = 4.0 + (r - g) / d
+                h = (h / 6.0) % 1.0
+            out[i, 0] = h
+            out[i, 1] = l
+            out[i, 2] = s
+
+
+def _hex_to_hls_arrays(hex_colors):
+    """Decodes '#rrggbb' strings straight to (hue, lightness, saturation) arrays."""
+    if njit is not None:
+        codes = _hex_to_code_array(hex_colors)
+        out = np.empty((len(hex_colors), 3), dtype=np.float32)
+        _codes_to_hls_jit(codes, _HEX_NIBBLE, out)
+        return out[:, 0], out[:, 1], out[:, 2]
+    return _rgb_to_hls_array(_hex_to_rgb_array(hex_colors))
+
+
+if njit is not None:
+    # One-time warmup so the JIT compile doesn't land inside the first palette load
+    _hex_to_hls_arrays(["#000000"])
+
+
+@functools.lru_cache(maxsize=32)
+def _seeded_permutation(seed, n):
+    """Deterministic shuffle permutation for a given seed and palette size.
+
+    Caching the permutation (rather than reusing a live RNG) keeps repeated
+    shuffles with the same seed reproducible while skipping both the
+    Generator construction and the permutation draw.
+    """
+    return np.random.default_rng(seed=seed).permutation(n)
+
+
+@functools.lru_cache(maxsize=8)
+def _preview_styles(font_name, font_size):
+    """Builds (name_style, label_style) once per font/size pair; Style loads fonts."""
+    name_style = Style(font_name, font_size * 1.2, load_font=True, wght=0.4)
+    label_style = Style(font_name, font_size, load_font=True, wght=0.60)
+    return name_style, label_style
+
+
+# '#rrggbb' with an optional alpha pair; used to validate up front so the
+# parsing loops can run without per-iteration exception handlers
+_HEX_COLOR_RE = re.compile(r"\A#[0-9a-fA-F]{6}([0-9a-fA-F]{2})?\Z")
+
+
+# Helper function for sorting keys with error handling (scalar fallback path)
 def _get_hls_hue_safe(hex_color):
-    try:
-        r = int(hex_color[1:3], 16) / 255.0
-        g = int(hex_color[3:5], 16) / 255.0
-        b = int(hex_color[5:7], 16) / 255.0
-        hls = colorsys.rgb_to_hls(r, g, b)
-        return hls[0] # Return hue
-    except (ValueError, IndexError, TypeError) as e:
-        print(f"Warning: Error getting HLS hue for sorting color '{hex_color}': {e}. Using hue 0.0.")
+    if not isinstance(hex_color, str) or not _HEX_COLOR_RE.match(hex_color):
+        log.warning("Invalid hex color '%s' for hue sorting. Using hue 0.0.", hex_color)
         return 0.0 # Return default hue on error
+    import colorsys
+    # bytes.fromhex parses all three channels in one C call
+    r, g, b = bytes.fromhex(hex_color[1:7])
+    return colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)[0] # Return hue
 
 class PaletteManager:
+    # Process-wide caches: the palette-name list and sampled base palettes
+    # are shared by every instance and only built once
+    _cached_names = None
+    _base_hex_cache = {}
+
+    @classmethod
+    def _load_palette_names(cls):
+        """(Internal) Returns the palette names as a bytes array, loading the dataset once per process."""
+        if cls._cached_names is None:
+            from pypalettes import get_colors
+            # ASCII bytes instead of str: ~4x smaller and vector-indexable
+            cls._cached_names = np.array(list(get_colors._load_palettes().keys()), dtype='S')
+        return cls._cached_names
+
     def __init__(self, config_path="palette_config.json"):
         self.config_path = config_path
-        self.palette_names = list(get_colors._load_palettes().keys())
-        self.palette = []
-        self.palette_hex = []
+        # Palette is stored struct-of-arrays: parallel hue/lightness/saturation
+        # float32 arrays plus the hex strings. hsl objects are built lazily on
+        # access so shuffle/rotate/sort stay pure array ops.
+        self.h = np.empty(0, dtype=np.float32)
+        self.l = np.empty(0, dtype=np.float32)
+        self.s = np.empty(0, dtype=np.float32)
+        self.palette_hex = np.empty(0, dtype='S9')
         self.colors = {}
+        # name -> palette index, derived from config ratios; rebuilt only when
+        # the palette length or the color_indices config change
+        self._named_idx = {}
         self.current_palette_name = ""
-        self.config = self._load_config() # Load config first
+        # Bumped whenever palette contents/order change; invalidates preview cache
+        self._version = 0
+        self._preview_cache = {}
+        # Config tuple the current palette state was derived from; None when
+        # the state is stale (fresh base) or diverged (manual transforms)
+        self._state_key = None
+        # Overlap the config-file read with the palette-dataset load;
+        # both are blocking I/O and independent of each other
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            names_future = ex.submit(self._load_palette_names)
+            config_future = ex.submit(self._read_config_bytes)
+            self.palette_names = names_future.result()
+            self.config = self._load_config(config_future.result())
         self._load_base_palette()      # Load base palette based on config index
         # Note: Transforms are NOT automatically applied on init
-        print(f"Initialized PaletteManager: Loaded base palette '{self.current_palette_name}' ({self.config.get('palette_idx')}) with {len(self.palette)} colors.")
+        log.info("Initialized PaletteManager: Loaded base palette '%s' (%s) with %d colors.", self.current_palette_name, self.config.get('palette_idx'), len(self))
 
-    def _load_config(self):
+    def _read_config_bytes(self):
+        """(Internal) Reads the raw config file, or None if it does not exist."""
         try:
-            with open(self.config_path, 'r') as f:
-                config_data = json.load(f)
-                # Ensure essential keys have defaults if missing
-                config_data.setdefault("palette_idx", 836)
-                config_data.setdefault("seed", 42)
-                config_data.setdefault("rotate_amount", 0)
-                config_data.setdefault("max_colors", 16)
-                config_data.setdefault("color_indices", {"bg": 0.06, "fg": 0.62})
-                return config_data
+            with open(self.config_path, 'rb') as f:
+                return f.read()
         except FileNotFoundError:
-            print(f"Config file '{self.config_path}' not found. Using default configuration.")
+            return None
+
+    def _load_config(self, config_bytes=None):
+        if config_bytes is None:
+            config_bytes = self._read_config_bytes()
+        if config_bytes is not None:
+            config_data = json.loads(config_bytes)
+            # Ensure essential keys have defaults if missing
+            config_data.setdefault("palette_idx", 836)
+            config_data.setdefault("seed", 42)
+            config_data.setdefault("rotate_amount", 0)
+            config_data.setdefault("max_colors", 16)
+            config_data.setdefault("color_indices", {"bg": 0.06, "fg": 0.62})
+            return config_data
+        else:
+            log.warning("Config file '%s' not found. Using default configuration.", self.config_path)
             # Return a copy of the default config
             return {
                 "palette_idx": 836,
@@ -61,25 +244,27 @@ class PaletteManager:
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(self.config, f, indent=2)
-            print(f"Configuration saved to '{self.config_path}'.")
+            log.info("Configuration saved to '%s'.", self.config_path)
         except Exception as e:
-            print(f"Error saving configuration to '{self.config_path}': {e}")
+            log.error("Error saving configuration to '%s': %s", self.config_path, e)
         return self # Allow chaining
 
     def update_config(self, key, value):
         """Updates a configuration value in memory. Does not save automatically."""
         if key in self.config:
             self.config[key] = value
-            print(f"Config updated: {key} = {value}")
+            log.debug("Config updated: %s = %s", key, value)
+            if key == "color_indices":
+                self._rebuild_named_idx()
             # Consider if certain updates should trigger a reload or partial update?
             # For now, requires manual reload() or specific method calls.
         else:
-            print(f"Warning: Config key '{key}' not found.")
+            log.warning("Config key '%s' not found.", key)
         return self # Allow chaining
 
     def reload(self):
         """Reloads config from file, reloads base palette, applies config transforms."""
-        print(f"Reloading configuration from '{self.config_path}'...")
+        log.debug("Reloading configuration from '%s'...", self.config_path)
         self.config = self._load_config()
         self._load_base_palette()
         self.apply_config_transforms()
@@ -92,58 +277,101 @@ class PaletteManager:
         max_colors = self.config.get("max_colors", 16)
 
         if not (0 <= palette_idx < len(self.palette_names)):
-            print(f"Warning: palette_idx {palette_idx} out of bounds. Correcting to 0.")
+            log.warning("palette_idx %s out of bounds. Correcting to 0.", palette_idx)
             palette_idx = 0
             self.config["palette_idx"] = 0
 
-        self.current_palette_name = self.palette_names[palette_idx]
-        try:
-            cmap = load_cmap(self.current_palette_name)
-        except Exception as e:
-            print(f"Error loading cmap '{self.current_palette_name}': {e}. Using empty palette.")
-            self.palette_hex = []
-            self.palette = []
-            return
-
-        # Sample and sort colors
-        if len(cmap.colors) > max_colors:
+        self.current_palette_name = self.palette_names[palette_idx].decode()
+        cache_key = (palette_idx, max_colors)
+        cached = self._base_hex_cache.get(cache_key)
+        if cached is None:
             try:
-                sorted_colors = sorted(cmap.colors, key=_get_hls_hue_safe)
-                step = len(sorted_colors) // (max_colors - 1) if max_colors > 1 else 1
-                base_hex = [sorted_colors[i * step] for i in range(max_colors)]
-                if max_colors > 0 and sorted_colors[-1] not in base_hex:
-                    base_hex[-1] = sorted_colors[-1]
+                cmap = _load_cmap_cached(self.current_palette_name)
             except Exception as e:
-                 print(f"Error during color sorting/sampling for '{self.current_palette_name}': {e}. Using unsorted colors.")
-                 base_hex = list(cmap.colors)[:max_colors]
-        else:
-            base_hex = list(cmap.colors)
-
-        self.palette_hex = base_hex
-        # Convert hex to HSL objects
-        new_palette = []
-        for c in self.palette_hex:
+                log.error("Error loading cmap '%s': %s. Using empty palette.", self.current_palette_name, e)
+                self.palette_hex = np.empty(0, dtype='S9')
+                self.h = np.empty(0, dtype=np.float32)
+                self.l = np.empty(0, dtype=np.float32)
+                self.s = np.empty(0, dtype=np.float32)
+                self._rebuild_named_idx() # Clears the map; indices from the old palette are stale
+                self._state_key = None # State no longer matches any config; retries must not short-circuit
+                return
+
+            # Sample and sort colors (as an ASCII bytes array throughout)
+            colors = np.asarray(list(cmap.colors), dtype='S')
             try:
-                r = int(c[1:3], 16) / 255.0
-                g = int(c[3:5], 16) / 255.0
-                b = int(c[5:7], 16) / 255.0
-                hls_tuple = colorsys.rgb_to_hls(r, g, b)
-                h, l, s = hls_tuple
-                new_palette.append(hsl(h, s, l))
-            except (ValueError, IndexError, TypeError) as e:
-                print(f"Warning: Error converting hex '{c}' to HSL: {e}. Appending black.")
-                new_palette.append(hsl(0, 0, 0))
-        self.palette = new_palette
+                # One vectorized decode of the whole cmap: the hue array
+                # drives the sort and the same H/L/S rows become the palette,
+                # so the sampled colors are never re-parsed
+                h_all, l_all, s_all = _hex_to_hls_arrays(colors)
+                if len(colors) > max_colors:
+                    order = np.argsort(h_all, kind="stable")
+                    # Evenly spaced indices with exact endpoints; replaces the
+                    # step arithmetic and last-element fixup
+                    idx = np.linspace(0, len(colors) - 1, max_colors).astype(np.int64)
+                    sel = order[idx]
+                else:
+                    sel = np.arange(len(colors))
+                cached = (colors[sel],
+                          h_all[sel].astype(np.float32, copy=False),
+                          l_all[sel].astype(np.float32, copy=False),
+                          s_all[sel].astype(np.float32, copy=False))
+            except Exception as e:
+                log.warning("Vectorized hex->HSL conversion failed for '%s': %s. Falling back to unsorted per-color conversion.", self.current_palette_name, e)
+                import colorsys
+                base_hex = colors[:max_colors]
+                # Validate the whole batch once so the conversion loop needs no
+                # per-iteration exception handler
+                hex_list = [c.decode() if isinstance(c, bytes) else c for c in base_hex]
+                valid = [isinstance(c, str) and bool(_HEX_COLOR_RE.match(c)) for c in hex_list]
+                if not all(valid):
+                    bad = [c for c, ok in zip(hex_list, valid) if not ok]
+                    log.warning("Found %d invalid hex entries (e.g. %s). Substituting black.", len(bad), bad[:3])
+                h_list, l_list, s_list = [], [], []
+                for c, ok in zip(hex_list, valid):
+                    if ok:
+                        r, g, b = bytes.fromhex(c[1:7])
+                        h, l, s = colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)
+                    else:
+                        h, l, s = 0.0, 0.0, 0.0
+                    h_list.append(h); l_list.append(l); s_list.append(s)
+                cached = (base_hex,
+                          np.array(h_list, dtype=np.float32),
+                          np.array(l_list, dtype=np.float32),
+                          np.array(s_list, dtype=np.float32))
+            self._base_hex_cache[cache_key] = cached
+
+        # Transforms always replace (never mutate) these arrays, so sharing
+        # them with the cache is safe
+        self.palette_hex, self.h, self.l, self.s = cached
+        self._rebuild_named_idx()
+        self._version += 1
+        self._state_key = None # Fresh base; transforms not applied yet
         # Do not assign named colors here, happens after transforms
 
+    def _config_state_key(self, palette_idx=None):
+        """(Internal) Config tuple that fully determines the transformed palette."""
+        if palette_idx is None:
+            palette_idx = self.config.get("palette_idx")
+        return (palette_idx, self.config.get("max_colors"),
+                self.config.get("seed"), self.config.get("rotate_amount"))
+
     def apply_config_transforms(self):
-        """Applies shuffle and rotate based on current config values."""
+        """Applies shuffle and rotate based on current config values. No-op if already applied."""
+        state_key = self._config_state_key()
+        if state_key == self._state_key:
+            log.debug("Config transforms already applied for %s; skipping.", state_key)
+            return self
         seed = self.config.get("seed")
         rotate_amount = self.config.get("rotate_amount")
-        print(f"Applying config transforms: Seed={seed}, Rotation={rotate_amount}")
+        log.debug("Applying config transforms: Seed=%s, Rotation=%s", seed, rotate_amount)
         self._shuffle(seed) # Use internal shuffle
         self._rotate(rotate_amount) # Use internal rotate
         self._assign_named_colors()
+        if len(self) > 0:
+            # An empty palette (failed load) is never marked applied, so a
+            # retry with the same config reloads instead of short-circuiting
+            self._state_key = state_key
         self._print_status("Applied config transforms")
         return self
 
@@ -152,6 +380,7 @@ class PaletteManager:
         """Shuffles the palette with a specific seed (or config seed if None)."""
         current_seed = seed if seed is not None else self.config.get("seed")
         self._shuffle(current_seed)
+        self._state_key = None # Manual transform; state no longer config-derived
         self._assign_named_colors()
         self._print_status(f"Shuffled with seed {current_seed}")
         return self
@@ -160,58 +389,72 @@ class PaletteManager:
         """Rotates the palette by a specific amount (or config amount if None)."""
         rotate_amount = amount if amount is not None else self.config.get("rotate_amount")
         self._rotate(rotate_amount)
+        self._state_key = None # Manual transform; state no longer config-derived
         self._assign_named_colors()
         self._print_status(f"Rotated by {rotate_amount}")
         return self
 
     # Internal, non-chainable versions for use by apply_config_transforms
     def _shuffle(self, seed):
-        if not self.palette: return
+        if len(self) == 0: return
         if seed is None: seed = 42 # Default if absolutely no seed found
 
-        rng = np.random.default_rng(seed=int(seed))
-        indices = np.arange(len(self.palette))
-        rng.shuffle(indices)
-        self.palette = [self.palette[i] for i in indices]
-        self.palette_hex = [self.palette_hex[i] for i in indices]
+        # One cached permutation, one fancy-index gather per array
+        perm = _seeded_permutation(int(seed), len(self))
+        self.h = self.h[perm]
+        self.l = self.l[perm]
+        self.s = self.s[perm]
+        self.palette_hex = self.palette_hex[perm]
+        self._version += 1
 
     def _rotate(self, amount):
-        if not self.palette: return
+        if len(self) == 0: return
         if amount is None: amount = 0 # Default if no amount found
 
-        num_colors = len(self.palette)
-        if num_colors == 0: return
+        num_colors = len(self)
         rotate_amount = int(amount) % num_colors
 
         if rotate_amount != 0:
-            palette_deque = deque(self.palette)
-            palette_deque.rotate(rotate_amount)
-            self.palette = list(palette_deque)
-            hex_deque = deque(self.palette_hex)
-            hex_deque.rotate(rotate_amount)
-            self.palette_hex = list(hex_deque)
+            k = rotate_amount
+            self.h = np.roll(self.h, k)
+            self.l = np.roll(self.l, k)
+            self.s = np.roll(self.s, k)
+            self.palette_hex = np.roll(self.palette_hex, k)
+            self._version += 1
+
+    def _color_at(self, idx):
+        """(Internal) Builds an hsl color from the SoA arrays at the given index."""
+        return hsl(float(self.h[idx]), float(self.s[idx]), float(self.l[idx]))
+
+    def _rebuild_named_idx(self):
+        """(Internal) Precomputes name -> palette index from the config ratios."""
+        num_palette_colors = len(self)
+        self._named_idx = {}
+        if num_palette_colors == 0: return
+
+        for name, index_ratio in self.config.get("color_indices", {}).items():
+            self._named_idx[name] = int(float(index_ratio) * num_palette_colors) % num_palette_colors
 
     def _assign_named_colors(self):
         """(Internal) Assigns named colors based on current palette order and config."""
-        self.colors = {}
-        num_palette_colors = len(self.palette)
-        if num_palette_colors == 0: return
-
-        color_indices = self.config.get("color_indices", {})
-        for name, index_ratio in color_indices.items():
-            idx = int(float(index_ratio) * num_palette_colors) % num_palette_colors
-            self.colors[name] = self.palette[idx]
+        self.colors = {name: self._color_at(idx) for name, idx in self._named_idx.items()}
 
     def _print_status(self, action="Status"):
-        """(Internal) Helper to print current status."""
+        """(Internal) Helper to log current status; skipped unless DEBUG is enabled."""
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         palette_idx = self.config.get("palette_idx", "N/A")
         # Note: These reflect config values, not necessarily the state after manual calls
         seed = self.config.get("seed", "N/A")
         rotate_amount = self.config.get("rotate_amount", "N/A")
-        print(f"{action}: Palette '{self.current_palette_name}' ({palette_idx}), {len(self.palette)} colors (Config Seed: {seed}, Config Rotation: {rotate_amount}) Named: {list(self.colors.keys())}")
+        log.debug("%s: Palette '%s' (%s), %d colors (Config Seed: %s, Config Rotation: %s) Named: %s",
+                  action, self.current_palette_name, palette_idx, len(self), seed, rotate_amount, list(self.colors.keys()))
 
     def load_palette_by_index(self, index):
-        """Loads a new base palette by index and applies config transforms."""
+        """Loads a new base palette by index and applies config transforms. No-op if unchanged."""
+        if self._config_state_key(palette_idx=index) == self._state_key:
+            log.debug("Palette %s already loaded and transformed; skipping.", index)
+            return self
         self.update_config("palette_idx", index) # Update config
         self._load_base_palette() # Load new base
         self.apply_config_transforms() # Apply transforms from (potentially updated) config
@@ -222,36 +465,45 @@ class PaletteManager:
         return self.colors.get(name, hsl(0,0,0))
 
     def __len__(self):
-        return len(self.palette)
+        return len(self.h)
 
     def __getitem__(self, index):
         """Gets a color by index (e.g., pm[0]), wraps around. Returns black if palette empty."""
-        if not self.palette:
+        if len(self.h) == 0:
              return hsl(0,0,0)
-        return self.palette[index % len(self.palette)]
+        return self._color_at(index % len(self.h))
 
     def preview(self, rect: Rect, font_name="Azeret", font_size=12, label_offset=3):
-        """Creates a visual preview of the current palette within the given rect."""
+        """Creates a visual preview of the current palette within the given rect.
+
+        The built preview is cached and reused until the palette changes, so
+        per-frame calls with the same rect/font are free.
+        """
         box = P()
-        if len(self.palette) == 0:
+        if len(self) == 0:
             return box # Return empty P if no palette
 
+        cache_key = (rect.x, rect.y, rect.w, rect.h, font_name, font_size, label_offset, self._version)
+        cached = self._preview_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         preview_rect = rect.inset(10) # Add some padding
-        s = Scaffold(preview_rect).grid(1, len(self.palette)) # Grid for colors
+        s = Scaffold(preview_rect).grid(1, len(self)) # Grid for colors
 
         # Add palette name label
         try:
-            name_style = Style(font_name, font_size * 1.2, load_font=True, wght=0.4)
+            name_style, label_style = _preview_styles(font_name, font_size)
             box += (
                 StSt(self.current_palette_name, name_style)
                 .f(self[len(self)//2]) # Use middle color for name
                 .align(preview_rect, "NW")
             )
         except Exception as e:
-            print(f"Warning: Could not render palette name preview: {e}")
+            log.warning("Could not render palette name preview: %s", e)
+            label_style = Style(font_name, font_size, load_font=True, wght=0.60)
 
         # Add color boxes and hex labels
-        label_style = Style(font_name, font_size, load_font=True, wght=0.60)
         for i, cell in enumerate(s):
             # Color box
             box.append(
@@ -260,11 +512,13 @@ class PaletteManager:
             # Hex label
             try:
                  box.append(
-                    StSt(self.palette_hex[i], label_style)
+                    StSt(self.palette_hex[i].decode(), label_style)
                     .f(self[(i + label_offset) % len(self)]) # Offset label color
                     .align(cell)
                 )
             except Exception as e:
-                 print(f"Warning: Could not render hex label preview for {self.palette_hex[i]}: {e}")
+                 log.warning("Could not render hex label preview for %s: %s", self.palette_hex[i], e)
 
+        # Keep only the most recent preview; palettes change rarely
+        self._preview_cache = {cache_key: box}
         return box